@@ -352,7 +352,10 @@ class DataFrameModel(Generic[TDataFrame, TSchema], BaseModel):
                     f"'{field_name}' can only be assigned a 'Field', "
                     + f"not a '{type(field)}.'"
                 )
-            fields[field.name] = (AnnotationInfo(annotation), field)
+            fields[field.name] = (
+                AnnotationInfo.from_annotation(annotation),
+                field,
+            )
         return fields
 
     @classmethod
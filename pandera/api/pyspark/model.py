@@ -389,7 +389,10 @@ class DataFrameModel(BaseModel):
                     f"'{field_name}' can only be assigned a 'Field', "
                     + f"not a '{type(field)}'."
                 )
-            fields[field.name] = (AnnotationInfo(annotation), field)
+            fields[field.name] = (
+                AnnotationInfo.from_annotation(annotation),
+                field,
+            )
 
         return fields
 
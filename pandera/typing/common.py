@@ -1,19 +1,21 @@
 """Common typing functionality."""
 
-import copy
+import functools
 import inspect
+import types
+import weakref
 from typing import (  # type: ignore[attr-defined]
     TYPE_CHECKING,
     Any,
     Generic,
+    Literal,
     Optional,
     TypeVar,
     Union,
     _GenericAlias,
+    _SpecialGenericAlias,
 )
 
-import typing_inspect
-
 from pandera import dtypes, errors
 
 Bool = dtypes.Bool  #: ``"bool"`` numpy dtype
@@ -75,7 +77,7 @@ else:
     T = DataFrameModel
 
 
-__orig_generic_alias_call = copy.copy(_GenericAlias.__call__)
+__orig_generic_alias_call = _GenericAlias.__call__
 
 
 def __patched_generic_alias_call(self, *args, **kwargs):
@@ -84,7 +86,7 @@ def __patched_generic_alias_call(self, *args, **kwargs):
     can be raised when instantiating an instance of pandera DataFrame generics,
     e.g. DataFrame[A](data).
     """
-    if DataFrameBase not in self.__origin__.__bases__:
+    if not getattr(self.__origin__, "_pandera_generic", False):
         return __orig_generic_alias_call(self, *args, **kwargs)
 
     if not self._inst:
@@ -113,6 +115,32 @@ def __patched_generic_alias_call(self, *args, **kwargs):
 _GenericAlias.__call__ = __patched_generic_alias_call
 
 
+_MRO_NAMES: "weakref.WeakKeyDictionary[type, frozenset[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _mro_names(cls: type) -> frozenset[str]:
+    """Names of the classes in the method resolution order of a class."""
+    try:
+        return _MRO_NAMES[cls]
+    except (KeyError, TypeError):
+        pass
+    names = frozenset(x.__name__ for x in inspect.getmro(cls))
+    if isinstance(cls, type):
+        _MRO_NAMES[cls] = names
+    return names
+
+
+def _is_dataframe_model(cls: type) -> bool:
+    """Whether a class derives from a ``DataFrameModel``.
+
+    The check is done by name since the model classes are defined in
+    :mod:`pandera.api`, which depends on this module.
+    """
+    return "DataFrameModel" in _mro_names(cls)
+
+
 class DataFrameBase(Generic[T]):
     """
     Pandera Dataframe base class for validating dataframes on
@@ -120,34 +148,35 @@ class DataFrameBase(Generic[T]):
     """
 
     default_dtype: Optional[type] = None
+    # marks pandera dataframe generics for __patched_generic_alias_call
+    _pandera_generic = True
 
     def __setattr__(self, name: str, value: Any) -> None:
         object.__setattr__(self, name, value)
-        if name == "__orig_class__":
-            orig_class = value
-            class_args = getattr(orig_class, "__args__", None)
-            if class_args is not None and any(
-                x.__name__ == "DataFrameModel"
-                for x in inspect.getmro(class_args[0])
-            ):
-                schema_model = value.__args__[0]
-                schema = schema_model.to_schema()
-            else:
-                raise TypeError("Could not find DataFrameModel in class args")
-
-            # prevent the double validation problem by preventing checks for
-            # dataframes with a defined pandera.schema
-            pandera_accessor = getattr(self, "pandera", None)
-
-            if (
-                pandera_accessor is None
-                or pandera_accessor.schema is None
-                or pandera_accessor.schema != schema
-            ):
-                self.__dict__.update(schema.validate(self).__dict__)
-                if pandera_accessor is None:
-                    pandera_accessor = getattr(self, "pandera")
-                pandera_accessor.add_schema(schema)
+        if name != "__orig_class__":
+            return
+
+        orig_class = value
+        class_args = getattr(orig_class, "__args__", None)
+        if class_args is not None and _is_dataframe_model(class_args[0]):
+            schema_model = value.__args__[0]
+            schema = schema_model.to_schema()
+        else:
+            raise TypeError("Could not find DataFrameModel in class args")
+
+        # prevent the double validation problem by preventing checks for
+        # dataframes with a defined pandera.schema
+        pandera_accessor = getattr(self, "pandera", None)
+
+        if (
+            pandera_accessor is None
+            or pandera_accessor.schema is None
+            or pandera_accessor.schema != schema
+        ):
+            self.__dict__.update(schema.validate(self).__dict__)
+            if pandera_accessor is None:
+                pandera_accessor = getattr(self, "pandera")
+            pandera_accessor.add_schema(schema)
 
 
 class SeriesBase(Generic[GenericDtype]):
@@ -175,6 +204,36 @@ class IndexBase(Generic[GenericDtype]):
         raise AttributeError("Indexes should resolve to pa.Index-s")
 
 
+_NONE_TYPE = type(None)
+_GENERIC_ALIAS_TYPES = (
+    _GenericAlias,
+    _SpecialGenericAlias,
+    types.GenericAlias,
+)
+# PEP 604 unions, e.g. ``int | None``, are only available in python >= 3.10
+_UNION_TYPES: tuple[Any, ...] = (
+    (types.UnionType,) if hasattr(types, "UnionType") else ()
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _has_signature(obj: Any) -> bool:
+    """Whether a signature can be provided for a callable."""
+    try:
+        inspect.signature(obj)
+    except ValueError:
+        return False
+    return True
+
+
+# Parsed annotations keyed by ``id(raw_annotation)``. The raw annotation is
+# stored alongside its parsed info so that the id cannot be recycled while
+# the entry is alive. The oldest entries are evicted once the cache is full so
+# that annotations of dynamically created models aren't kept alive forever.
+_ANNOTATION_CACHE: dict[int, tuple[Any, "AnnotationInfo"]] = {}
+_ANNOTATION_CACHE_MAXSIZE = 1024
+
+
 class AnnotationInfo:
     """Captures extra information about an annotation.
 
@@ -189,66 +248,120 @@ class AnnotationInfo:
         metadata: Extra arguments passed to :data:`typing.Annotated`.
     """
 
+    __slots__ = (
+        "raw_annotation",
+        "origin",
+        "args",
+        "arg",
+        "literal",
+        "optional",
+        "is_annotated_type",
+        "metadata",
+        "default_dtype",
+        "_is_generic_df",
+    )
+
     def __init__(self, raw_annotation: type) -> None:
         self._parse_annotation(raw_annotation)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # needed to pickle slotted instances with protocols 0 and 1
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_annotation(cls, raw_annotation: Any) -> "AnnotationInfo":
+        """Get the parsed :class:`AnnotationInfo` of an annotation.
+
+        Results are memoized per annotation object, so repeated lookups of the
+        same (shared) type hint don't re-parse it.
+
+        :param raw_annotation: A type annotation.
+        :returns: The :class:`AnnotationInfo` of the annotation.
+        """
+        cached = _ANNOTATION_CACHE.get(id(raw_annotation))
+        if cached is not None and cached[0] is raw_annotation:
+            return cached[1]
+        annotation_info = cls(raw_annotation)
+        if len(_ANNOTATION_CACHE) >= _ANNOTATION_CACHE_MAXSIZE:
+            _ANNOTATION_CACHE.pop(next(iter(_ANNOTATION_CACHE)), None)
+        _ANNOTATION_CACHE[id(raw_annotation)] = (
+            raw_annotation,
+            annotation_info,
+        )
+        return annotation_info
+
     @property
     def is_generic_df(self) -> bool:
         """True if the annotation is a DataFrameBase subclass."""
-        try:
-            if self.origin is None:
-                return False
-            return issubclass(self.origin, DataFrameBase)
-        except TypeError:
-            return False
-
-    def _parse_annotation(self, raw_annotation: type) -> None:
+        return self._is_generic_df
+
+    def _parse_annotation(self, raw_annotation: Any) -> None:
         """Parse key information from annotation.
 
         :param annotation: A subscripted type.
         :returns: Annotation
         """
-        self.raw_annotation = raw_annotation
-        self.origin = self.arg = None
-        self.is_annotated_type = False
-
-        self.optional = typing_inspect.is_optional_type(raw_annotation)
-        if self.optional and typing_inspect.is_union_type(raw_annotation):
-            # Annotated with Optional or Union[..., NoneType]
-            # get_args -> (pandera.typing.Index[str], <class 'NoneType'>)
-            raw_annotation = typing_inspect.get_args(raw_annotation)[0]
-            self.raw_annotation = raw_annotation
-
-        self.origin = typing_inspect.get_origin(raw_annotation)
-        # Replace empty tuple returned from get_args by None
-        args = typing_inspect.get_args(raw_annotation) or None
-        self.args = args
-        self.arg = args[0] if args else args
+        origin: Any = None
+        is_annotated_type = False
+
+        optional = raw_annotation is _NONE_TYPE
+        if isinstance(raw_annotation, _UNION_TYPES) or (
+            isinstance(raw_annotation, _GenericAlias)
+            and raw_annotation.__origin__ is Union
+        ):
+            if _NONE_TYPE in raw_annotation.__args__:
+                # Annotated with Optional, Union[..., NoneType] or X | None
+                # __args__ -> (pandera.typing.Index[str], <class 'NoneType'>)
+                optional = True
+                raw_annotation = raw_annotation.__args__[0]
+
+        if isinstance(raw_annotation, _GENERIC_ALIAS_TYPES):
+            origin = raw_annotation.__origin__
+            # special aliases, e.g. typing.List, don't have __args__
+            args = getattr(raw_annotation, "__args__", None) or None
+        elif isinstance(raw_annotation, _UNION_TYPES):
+            args = raw_annotation.__args__
+        else:
+            args = None
+        arg: Any = args[0] if args else args
 
         metadata = getattr(raw_annotation, "__metadata__", None)
 
         if metadata:
-            self.is_annotated_type = True
-            try:
-                inspect.signature(self.arg)
-            except ValueError:
+            is_annotated_type = True
+            if not _has_signature(arg):
                 metadata = None
 
-        elif metadata := getattr(self.arg, "__metadata__", None):
-            self.arg = typing_inspect.get_args(self.arg)[0]
+        elif metadata := getattr(arg, "__metadata__", None):
+            arg = arg.__args__[0]
 
-        self.metadata = metadata
-        self.literal = typing_inspect.is_literal_type(self.arg)
+        literal = isinstance(arg, _GenericAlias) and arg.__origin__ is Literal
 
-        if self.literal:
-            self.arg = typing_inspect.get_args(self.arg)[0]
-        elif self.origin is None and self.metadata is None:
+        if literal:
+            arg = arg.__args__[0]
+        elif origin is None and metadata is None:
             if isinstance(raw_annotation, type) and issubclass(
                 raw_annotation, SeriesBase
             ):
                 # handle case where the provided annotation is just a pandera Series generic.
-                self.arg = Any
+                arg = Any
             else:
                 # otherwise assume that the annotation is the data type itself.
-                self.arg = raw_annotation
+                arg = raw_annotation
+
+        self.raw_annotation = raw_annotation
+        self.origin = origin
+        self.args = args
+        self.arg = arg
+        self.literal = literal
+        self.optional = optional
+        self.is_annotated_type = is_annotated_type
+        self.metadata = metadata
         self.default_dtype = getattr(raw_annotation, "default_dtype", None)
+        self._is_generic_df = isinstance(origin, type) and issubclass(
+            origin, DataFrameBase
+        )
@@ -1,15 +1,18 @@
 """Test typing annotations for the model api."""
 
+import pickle
 import re
-from typing import Any, Optional
+import sys
+from typing import Any, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
 import pytest
 
 import pandera.pandas as pa
+import pandera.typing.common
 from pandera.dtypes import DataType
-from pandera.typing import DataFrame, Index, Series
+from pandera.typing import AnnotationInfo, DataFrame, Index, Series
 
 try:  # python 3.9+
     from typing import Annotated  # type: ignore
@@ -501,6 +504,25 @@ def test_init_pandas_dataframe():
     )
 
 
+class CoerceInitSchema(pa.DataFrameModel):
+    col: Series[int] = pa.Field(coerce=True)
+
+
+def test_init_pandas_dataframe_coerce():
+    """Test that initializing a pandas.typing.DataFrame keeps the validated
+    data and the generic alias it was created from."""
+    df = DataFrame[CoerceInitSchema]({"col": [1.0, 2.0]})
+    assert df["col"].dtype == np.dtype("int64")
+    assert df.__orig_class__ == DataFrame[CoerceInitSchema]
+    assert df.pandera.schema == CoerceInitSchema.to_schema()
+
+    # in-place changes don't leak into the validated frame held by the
+    # pandera accessor
+    validated = df.pandera.add_schema(df.pandera.schema)
+    df.drop(index=0, inplace=True)
+    assert len(validated) == 2
+
+
 @pytest.mark.parametrize(
     "invalid_data",
     [
@@ -514,3 +536,93 @@ def test_init_pandas_dataframe_errors(invalid_data):
     """Test errors from initializing a pandas.typing.DataFrame with Schema."""
     with pytest.raises(pa.errors.SchemaError):
         DataFrame[InitSchema](invalid_data)
+
+
+def test_annotation_info_from_annotation_is_memoized():
+    """Test that AnnotationInfo.from_annotation reuses parsed annotations."""
+    annotation = Optional[Series[int]]
+    annotation_info = AnnotationInfo.from_annotation(annotation)
+    assert AnnotationInfo.from_annotation(annotation) is annotation_info
+    assert annotation_info.optional
+    assert annotation_info.arg is int
+
+
+def test_annotation_info_cache_is_bounded():
+    """Test that the AnnotationInfo.from_annotation cache evicts entries."""
+    maxsize = pandera.typing.common._ANNOTATION_CACHE_MAXSIZE
+    for _ in range(maxsize * 2):
+        # list[int] creates a new alias object on every evaluation
+        AnnotationInfo.from_annotation(list[int])
+    assert len(pandera.typing.common._ANNOTATION_CACHE) <= maxsize
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10),
+    reason="PEP 604 unions require python >= 3.10",
+)
+def test_check_types_does_not_grow_annotation_cache():
+    """Test that check_types doesn't cache annotations that are re-created
+    on every call, e.g. string PEP 604 unions."""
+
+    class InSchema(pa.DataFrameModel):
+        a: Series[int]
+
+    @pa.check_types
+    def transform(
+        df: DataFrame[InSchema], n: "int | None" = None
+    ) -> DataFrame[InSchema]:
+        return df
+
+    df = pd.DataFrame({"a": [1]})
+    transform(df, n=1)
+    cache_size = len(pandera.typing.common._ANNOTATION_CACHE)
+    for _ in range(100):
+        transform(df, n=1)
+    assert len(pandera.typing.common._ANNOTATION_CACHE) == cache_size
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_annotation_info_pickle(protocol):
+    """Test that AnnotationInfo round-trips through pickle."""
+    annotation_info = AnnotationInfo(Optional[Series[int]])
+    unpickled = pickle.loads(pickle.dumps(annotation_info, protocol=protocol))
+    assert unpickled.raw_annotation == annotation_info.raw_annotation
+    assert unpickled.origin is Series
+    assert unpickled.arg is int
+    assert unpickled.optional
+    assert unpickled.is_generic_df == annotation_info.is_generic_df
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        Optional[Series[int]],
+        Union[Series[int], None],
+    ],
+)
+def test_annotation_info_optional(annotation):
+    """Test parsing of optional annotations."""
+    annotation_info = AnnotationInfo(annotation)
+    assert annotation_info.optional
+    assert annotation_info.origin is Series
+    assert annotation_info.arg is int
+    assert not annotation_info.literal
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10),
+    reason="PEP 604 unions require python >= 3.10",
+)
+def test_annotation_info_pep604_optional():
+    """Test parsing of optional annotations using the X | None syntax."""
+    annotation_info = AnnotationInfo(eval("Series[int] | None"))
+    assert annotation_info.optional
+    assert annotation_info.origin is Series
+    assert annotation_info.arg is int
+
+
+def test_annotation_info_literal():
+    """Test parsing of literal annotations."""
+    annotation_info = AnnotationInfo(Series[Literal["a", "b"]])
+    assert annotation_info.literal
+    assert annotation_info.arg == "a"